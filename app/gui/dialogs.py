@@ -1,21 +1,54 @@
+import json
+import sqlite3
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit
 
 
 class DetailedLogDialog(QDialog):
-    def __init__(self, log_data, parent=None):
+    def __init__(self, log_data, parent=None, db_manager=None, rowid=None):
         super().__init__(parent)
         self.setWindowTitle("Log Details")
         self.setGeometry(200, 200, 600, 400)
-        self.setup_ui(log_data)
+        self.db_manager = db_manager
+        self.rowid = rowid
+        self.record_error = None
+        self.setup_ui(self.load_record(log_data))
+
+    def load_record(self, log_data):
+        """Load the full record by rowid, falling back to the grid values"""
+        if self.db_manager is None or self.rowid is None:
+            return log_data
+        try:
+            record = self.db_manager.get_record(self.rowid)
+        except sqlite3.Error as e:
+            self.record_error = str(e)
+            return log_data
+        if record is None:
+            self.record_error = f"no row with rowid {self.rowid}"
+            return log_data
+        return record
+
+    @staticmethod
+    def format_value(value):
+        """Pretty-print JSON values such as the EvtxECmd Payload column"""
+        if isinstance(value, str) and value.lstrip().startswith(('{', '[')):
+            try:
+                return "\n" + json.dumps(json.loads(value), indent=2)
+            except ValueError:
+                pass
+        return value
 
     def setup_ui(self, log_data):
         layout = QVBoxLayout()
         text_edit = QTextEdit()
         text_edit.setReadOnly(True)
 
+        if self.record_error:
+            text_edit.append(f"Could not load the full record ({self.record_error}); "
+                             f"showing grid columns only.\n")
+
         # Format and display log data
         for key, value in log_data.items():
-            text_edit.append(f"{key}: {value}")
+            text_edit.append(f"{key}: {self.format_value(value)}")
 
         layout.addWidget(text_edit)
-        self.setLayout(layout)
\ No newline at end of file
+        self.setLayout(layout)
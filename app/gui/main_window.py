@@ -3,27 +3,58 @@ from PyQt5.QtWidgets import (QMainWindow, QTableView, QVBoxLayout, QHBoxLayout,
                             QWidget, QPushButton, QLabel, QLineEdit, QFileDialog,
                             QCheckBox, QListWidget, QProgressBar, QMessageBox,
                             QStatusBar, QApplication)
-from PyQt5.QtCore import Qt, QSortFilterProxyModel
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QSettings, pyqtSignal
 from PyQt5.QtGui import QStandardItemModel, QStandardItem, QKeySequence
 import os
-from app.utils.database import DatabaseManager
-from app.utils.log_parser import LogParser
-from app.gui.dialogs import DetailedLogDialog
+from app.utils.database import DatabaseManager, DEFAULT_DB_PATH, ROWID_COLUMN
 
 class LogViewer(QMainWindow):
+    # Emitted once, after the window has been painted for the first time
+    first_painted = pyqtSignal()
+
     def __init__(self):
         super().__init__()
-        self.db_manager = DatabaseManager()
-        self.log_parser = LogParser()
+        self._painted = False
+        # Parser and database are created on first use to keep startup fast
+        self._db_manager = None
+        self._log_parser = None
+        self.settings = QSettings('EventWizard', 'EventWizard')
         self.setup_variables()
         self.setup_ui()
-        self.connect_signals()
 
         # Add status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.operation_status_dialog = None
 
+    @property
+    def db_manager(self):
+        if self._db_manager is None:
+            db_path = self.settings.value('last_case/db_path', DEFAULT_DB_PATH)
+            self._db_manager = DatabaseManager(db_path)
+            self.connect_signals()
+        return self._db_manager
+
+    def reset_db_path(self):
+        """Forget the saved case and point the database manager back at the default file"""
+        self.settings.remove('last_case/db_path')
+        if self._db_manager is not None:
+            self._db_manager.close_connection()
+            self._db_manager.db_path = DEFAULT_DB_PATH
+
+    @property
+    def log_parser(self):
+        if self._log_parser is None:
+            from app.utils.log_parser import LogParser
+            self._log_parser = LogParser()
+        return self._log_parser
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.first_painted.emit()
+
     def setup_variables(self):
         self.fields = []
         self.current_page = 1
@@ -150,9 +181,9 @@ class LogViewer(QMainWindow):
 
     def connect_signals(self):
         # Connect database manager signals
-        self.db_manager.progress_updated.connect(self.load_progress.setValue)
-        self.db_manager.operation_completed.connect(self.show_status_message)
-        self.db_manager.error_occurred.connect(self.show_error_message)
+        self._db_manager.progress_updated.connect(self.load_progress.setValue)
+        self._db_manager.operation_completed.connect(self.show_status_message)
+        self._db_manager.error_occurred.connect(self.show_error_message)
 
     def parse_logs(self):
         input_dir = QFileDialog.getExistingDirectory(self, "Select Log Directory")
@@ -214,7 +245,11 @@ class LogViewer(QMainWindow):
         if file_path:
             try:
                 self.load_progress.show()
+                # The new CSV replaces the case; only remember it once the import has completed
+                self.settings.remove('last_case/db_path')
+                self.clear_saved_searches()
                 self.fields = self.db_manager.load_csv(file_path)
+                self.settings.setValue('last_case/db_path', os.path.abspath(self.db_manager.db_path))
                 self.run_query()
             except Exception as e:
                 self.show_error_message(f"Error loading file: {str(e)}")
@@ -250,7 +285,8 @@ class LogViewer(QMainWindow):
             self.status_bar.showMessage("Database dropped successfully")
 
             # Clear saved searches if you want to (optional)
-            self.saved_searches_list.clear()
+            self.clear_saved_searches()
+            self.reset_db_path()
 
         except Exception as e:
             self.show_error_message(f"Error dropping database: {str(e)}")
@@ -261,14 +297,20 @@ class LogViewer(QMainWindow):
         if not query:
             query = "SELECT * FROM logs"
 
-        if hasattr(self.db_manager, 'conn'):
+        if self.db_manager.conn is not None:
             try:
                 cursor = self.db_manager.conn.cursor()
 
+                # Fetch only the grid columns; the detail view loads the full row
+                query = self.db_manager.project_query(query)
+
                 # Apply sorting if a column is selected
-                if self.current_sort_column is not None:
+                sort_item = (self.model.horizontalHeaderItem(self.current_sort_column)
+                             if self.current_sort_column is not None else None)
+                if sort_item is not None:
+                    sort_column = sort_item.text()
                     sort_order = "ASC" if self.current_sort_order == Qt.AscendingOrder else "DESC"
-                    query = f"SELECT * FROM ({query}) ORDER BY [{self.fields[self.current_sort_column]}] {sort_order}"
+                    query = f"SELECT * FROM ({query}) ORDER BY [{sort_column}] {sort_order}"
 
                 # Get total count
                 count_query = f"SELECT COUNT(*) FROM ({query})"
@@ -299,6 +341,8 @@ class LogViewer(QMainWindow):
                         QApplication.processEvents()  # Allow GUI to update
 
                 self.search_progress.setValue(100)
+                for col, name in enumerate(column_names):
+                    self.table.setColumnHidden(col, name == ROWID_COLUMN)
                 self.update_pagination_controls()
                 self.restore_column_states()
             except sqlite3.Error as e:
@@ -310,10 +354,13 @@ class LogViewer(QMainWindow):
         source_index = self.proxy_model.mapToSource(index)
         row = source_index.row()
         log_data = {
-            self.fields[col]: self.model.data(self.model.index(row, col))
+            self.model.horizontalHeaderItem(col).text(): self.model.data(self.model.index(row, col))
             for col in range(self.model.columnCount())
         }
-        dialog = DetailedLogDialog(log_data, self)
+        rowid = log_data.pop(ROWID_COLUMN, None)
+        from app.gui.dialogs import DetailedLogDialog
+        dialog = DetailedLogDialog(log_data, self, db_manager=self.db_manager,
+                                   rowid=int(rowid) if rowid is not None else None)
         dialog.exec_()
 
     def show_status_message(self, message):
@@ -350,6 +397,45 @@ class LogViewer(QMainWindow):
         query = self.search_bar.text()
         if query:
             self.saved_searches_list.addItem(query)
+            self.save_searches_state()
+
+    def save_searches_state(self):
+        """Persist the saved searches of the current case"""
+        searches = [self.saved_searches_list.item(i).text() for i in range(self.saved_searches_list.count())]
+        self.settings.setValue('last_case/saved_searches', searches)
+
+    def clear_saved_searches(self):
+        """Clear the saved searches of the current case"""
+        self.saved_searches_list.clear()
+        self.settings.remove('last_case/saved_searches')
+
+    def restore_last_case(self):
+        """
+        Reopen the last case database and its saved searches, then show its first page
+
+        Returns:
+            bool: True if a case was restored
+        """
+        db_path = self.settings.value('last_case/db_path')
+        if not db_path:
+            self.clear_saved_searches()
+            return False
+        self.fields = self.db_manager.open_existing()
+        if not self.fields:
+            if os.path.exists(db_path):
+                message = f"Last case database is corrupt or has no logs table: {db_path}"
+            else:
+                message = f"Last case database not found: {db_path}"
+            self.clear_saved_searches()
+            self.reset_db_path()
+            self.status_bar.showMessage(message)
+            return False
+
+        searches = self.settings.value('last_case/saved_searches', [], type=list)
+        self.saved_searches_list.addItems(searches)
+        self.run_query()
+        self.status_bar.showMessage(f"Restored case: {db_path}")
+        return True
 
     def load_saved_search(self, item):
         self.search_bar.setText(item.text())
@@ -1,5 +1,5 @@
 # log_viewer/utils/__init__.py
 from .database import DatabaseManager
-from .log_parser import LogParser
+from .startup_timer import StartupTimer
 
-__all__ = ['DatabaseManager', 'LogParser']
\ No newline at end of file
+__all__ = ['DatabaseManager', 'StartupTimer']
@@ -1,16 +1,36 @@
 import sqlite3
 import os
 import csv
+import re
 from PyQt5.QtCore import QObject, pyqtSignal
 
 
+# Database file used when no case has been restored
+DEFAULT_DB_PATH = 'logs.db'
+
+# Alias under which the grid query exposes each row's rowid
+ROWID_COLUMN = '__rowid__'
+
+# Wide columns left out of the grid and loaded only in the detail view
+DETAIL_ONLY_FIELDS = ('Payload',)
+
+# Matches the default "SELECT * FROM logs ..." shape that can be projected
+_SELECT_ALL_RE = re.compile(r'^\s*SELECT\s+\*\s+FROM\s+logs\b', re.IGNORECASE)
+
+# Compound, joined or multi-table queries that must not be projected
+_MULTI_SOURCE_RE = re.compile(
+    r'\b(?:UNION|INTERSECT|EXCEPT|JOIN)\b|^\s*SELECT\s+\*\s+FROM\s+logs(?:\s+(?:AS\s+)?\w+)?\s*,',
+    re.IGNORECASE
+)
+
+
 class DatabaseManager(QObject):
     # Signals for progress updates
     progress_updated = pyqtSignal(int)
     operation_completed = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
-    def __init__(self, db_path='logs.db'):
+    def __init__(self, db_path=DEFAULT_DB_PATH):
         super().__init__()
         self.db_path = db_path
         self.conn = None
@@ -26,6 +46,27 @@ class DatabaseManager(QObject):
         except sqlite3.Error as e:
             self.error_occurred.emit(f"Database connection error: {str(e)}")
             raise
+
+    def open_existing(self):
+        """
+        Connect to an existing database and load its column names
+
+        Returns:
+            list: Column names of the logs table, or an empty list if the file is
+            missing, is not a SQLite database or has no logs table
+        """
+        if not os.path.exists(self.db_path):
+            return []
+        try:
+            self.connect()
+            self.cursor.execute("PRAGMA table_info(logs)")
+            self.fields = [row[1] for row in self.cursor.fetchall()]
+        except sqlite3.Error:
+            self.fields = []
+        if not self.fields:
+            self.close_connection()
+        return self.fields
+
     def close_connection(self):
         """Close database connection"""
         if self.conn:
@@ -106,6 +147,50 @@ class DatabaseManager(QObject):
         """Get current table column names"""
         return self.fields
 
+    def get_grid_columns(self):
+        """Get the columns shown in the results grid"""
+        return [field for field in self.fields if field not in DETAIL_ONLY_FIELDS]
+
+    def project_query(self, query):
+        """
+        Rewrite a "SELECT * FROM logs ..." query to fetch only the grid columns
+
+        The rowid is selected as ROWID_COLUMN so the full record can be loaded
+        later with get_record(). Only a plain single-table SELECT is projected;
+        compound, joined and any other query shapes are returned unchanged.
+
+        Args:
+            query (str): SQL query entered by the user
+
+        Returns:
+            str: The projected query, or the original query if it can't be projected
+        """
+        if not self.fields or not _SELECT_ALL_RE.match(query) or _MULTI_SOURCE_RE.search(query):
+            return query
+        columns = ', '.join([f'rowid AS [{ROWID_COLUMN}]'] +
+                            [f'[{field}]' for field in self.get_grid_columns()])
+        return _SELECT_ALL_RE.sub(lambda _: f'SELECT {columns} FROM logs', query, count=1)
+
+    def get_record(self, rowid):
+        """
+        Get the full record for a single row
+
+        Args:
+            rowid (int): SQLite rowid of the record
+
+        Returns:
+            dict or None: Column name to value mapping, or None if the row doesn't exist
+
+        Raises:
+            sqlite3.Error: If the record can't be read; the caller reports it
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM logs WHERE rowid = ?", (rowid,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return {description[0]: value for description, value in zip(cursor.description, row)}
+
     def get_total_rows(self, query):
         """Get total number of rows for a query"""
         try:
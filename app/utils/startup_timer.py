@@ -0,0 +1,38 @@
+import sys
+import time
+
+
+class StartupTimer:
+    """Records elapsed time at each startup milestone"""
+
+    def __init__(self, start=None, enabled=False):
+        self.start = start if start is not None else time.perf_counter()
+        self.enabled = enabled
+        self.marks = []
+
+    def mark(self, label):
+        """Record a milestone with the time elapsed since start"""
+        self.marks.append((label, time.perf_counter() - self.start))
+
+    def total_ms(self):
+        """Get the elapsed time of the last milestone in milliseconds"""
+        return self.marks[-1][1] * 1000 if self.marks else 0.0
+
+    def report(self):
+        """
+        Build the startup timing report
+
+        Returns:
+            str: One line per milestone with its cumulative and step time
+        """
+        lines = ["Startup timing:"]
+        previous = 0.0
+        for label, elapsed in self.marks:
+            lines.append(f"  {elapsed * 1000:8.1f} ms  (+{(elapsed - previous) * 1000:7.1f} ms)  {label}")
+            previous = elapsed
+        return "\n".join(lines)
+
+    def print_report(self):
+        """Write the report to stderr if timing is enabled and a console is attached"""
+        if self.enabled and sys.stderr is not None:
+            print(self.report(), file=sys.stderr)
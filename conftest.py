@@ -0,0 +1,6 @@
+# conftest.py
+import os
+import sys
+
+# Make the app package importable when running plain `pytest` from the repo root
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -1,27 +1,67 @@
 # main.py
+import time
+_START_TIME = time.perf_counter()
+
 import sys
-import base64
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon, QPixmap
 import os
 
 # Add the current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from app.gui.main_window import LogViewer
-from app.resources.icon_base64 import ICON_DATA
+from app.utils.startup_timer import StartupTimer
+
+
+def load_window_icon(app):
+    """Load icon from embedded base64 data"""
+    import base64
+    from PyQt5.QtGui import QIcon, QPixmap
+    from app.resources.icon_base64 import ICON_DATA
 
-def main():
-    app = QApplication(sys.argv)
-    
-    # Load icon from embedded base64 data
     icon_data = base64.b64decode(ICON_DATA)
     pixmap = QPixmap()
     pixmap.loadFromData(icon_data)
     app.setWindowIcon(QIcon(pixmap))
-    
+
+
+def main():
+    # Pass --startup-timing (or set EVENT_WIZARD_STARTUP_TIMING=1) to print a timing report
+    timer = StartupTimer(
+        start=_START_TIME,
+        enabled='--startup-timing' in sys.argv or os.environ.get('EVENT_WIZARD_STARTUP_TIMING') == '1'
+    )
+
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import QTimer
+    timer.mark("Qt imported")
+
+    app = QApplication(sys.argv)
+    timer.mark("QApplication created")
+
+    from app.gui.main_window import LogViewer
     viewer = LogViewer()
+
+    def finish_startup():
+        # Queued from the first paint so restoring the case doesn't delay it
+        load_window_icon(app)
+        timer.mark("Icon loaded")
+        if viewer.restore_last_case():
+            timer.mark("First page of last case loaded")
+        else:
+            timer.mark("Ready (no case restored)")
+        timer.print_report()
+        if timer.enabled:
+            # Keep the restore outcome visible alongside the startup time
+            restore_status = viewer.status_bar.currentMessage()
+            startup_status = f"Startup took {timer.total_ms():.0f} ms"
+            viewer.status_bar.showMessage(f"{restore_status} ({startup_status})" if restore_status else startup_status)
+
+    def on_first_paint():
+        timer.mark("Main window painted")
+        QTimer.singleShot(0, finish_startup)
+
+    viewer.first_painted.connect(on_first_paint)
     viewer.show()
+    timer.mark("Main window created")
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
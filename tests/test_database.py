@@ -0,0 +1,121 @@
+import sqlite3
+
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from app.utils.database import DatabaseManager, ROWID_COLUMN
+
+
+@pytest.fixture
+def db_manager():
+    manager = DatabaseManager(':memory:')
+    manager.connect()
+    manager.fields = ['EventId', 'Channel', 'Payload']
+    manager.cursor.execute("CREATE TABLE logs ([EventId] TEXT, [Channel] TEXT, [Payload] TEXT)")
+    manager.cursor.executemany(
+        "INSERT INTO logs VALUES (?, ?, ?)",
+        [('4624', 'Security', '{"a": 1}'), ('4688', 'Security', '{"b": 2}')]
+    )
+    yield manager
+    manager.close_connection()
+
+
+def run(manager, query):
+    cursor = manager.conn.cursor()
+    cursor.execute(manager.project_query(query))
+    return [description[0] for description in cursor.description], cursor.fetchall()
+
+
+def test_plain_select_is_projected(db_manager):
+    columns, rows = run(db_manager, "SELECT * FROM logs WHERE EventId = '4624'")
+    assert columns == [ROWID_COLUMN, 'EventId', 'Channel']
+    assert rows == [(1, '4624', 'Security')]
+
+
+@pytest.mark.parametrize('query', [
+    "SELECT * FROM logs EXCEPT SELECT * FROM logs WHERE EventId = '4688'",
+    "SELECT * FROM logs UNION SELECT * FROM logs",
+    "SELECT * FROM logs INTERSECT SELECT * FROM logs WHERE EventId = '4624'",
+    "SELECT * FROM logs JOIN logs b ON logs.EventId = b.EventId",
+    "SELECT * FROM logs a, logs b WHERE a.EventId = b.EventId",
+    "select * from logs, logs b",
+])
+def test_multi_source_query_is_unchanged(db_manager, query):
+    assert db_manager.project_query(query) == query
+
+
+def test_except_query_keeps_its_result(db_manager):
+    _, rows = run(db_manager, "SELECT * FROM logs EXCEPT SELECT * FROM logs WHERE EventId = '4688'")
+    assert rows == [('4624', 'Security', '{"a": 1}')]
+
+
+def test_get_record_returns_full_row(db_manager):
+    assert db_manager.get_record(2) == {'EventId': '4688', 'Channel': 'Security', 'Payload': '{"b": 2}'}
+    assert db_manager.get_record(99) is None
+
+
+def test_get_record_error_is_raised_without_signal(db_manager):
+    errors = []
+    db_manager.error_occurred.connect(errors.append)
+    db_manager.cursor.execute("DROP TABLE logs")
+    with pytest.raises(sqlite3.Error):
+        db_manager.get_record(1)
+    assert errors == []
+
+
+def test_open_existing_missing_file(tmp_path):
+    manager = DatabaseManager(str(tmp_path / 'missing.db'))
+    assert manager.open_existing() == []
+    assert manager.conn is None
+    assert not (tmp_path / 'missing.db').exists()
+
+
+def test_open_existing_not_a_database(tmp_path):
+    path = tmp_path / 'corrupt.db'
+    path.write_bytes(b'not a sqlite database' * 100)
+    manager = DatabaseManager(str(path))
+    assert manager.open_existing() == []
+    assert manager.conn is None
+
+
+def test_open_existing_without_logs_table(tmp_path):
+    path = tmp_path / 'empty.db'
+    sqlite3.connect(str(path)).close()
+    manager = DatabaseManager(str(path))
+    assert manager.open_existing() == []
+    assert manager.conn is None
+
+
+def test_open_existing_loads_fields(tmp_path):
+    path = tmp_path / 'case.db'
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE logs ([EventId] TEXT, [Payload] TEXT)")
+    conn.close()
+    manager = DatabaseManager(str(path))
+    assert manager.open_existing() == ['EventId', 'Payload']
+    assert manager.conn is not None
+    manager.close_connection()
+
+
+def test_startup_timer_report():
+    from app.utils.startup_timer import StartupTimer
+
+    timer = StartupTimer(start=0.0)
+    assert timer.total_ms() == 0.0
+    timer.marks = [('Qt imported', 0.1), ('Main window painted', 0.25)]
+    assert timer.total_ms() == pytest.approx(250.0)
+    lines = timer.report().splitlines()
+    assert lines[0] == "Startup timing:"
+    assert lines[1].split() == ['100.0', 'ms', '(+', '100.0', 'ms)', 'Qt', 'imported']
+    assert lines[2].split() == ['250.0', 'ms', '(+', '150.0', 'ms)', 'Main', 'window', 'painted']
+
+
+def test_startup_timer_mark_is_cumulative():
+    from app.utils.startup_timer import StartupTimer
+
+    timer = StartupTimer()
+    timer.mark('first')
+    timer.mark('second')
+    assert [label for label, _ in timer.marks] == ['first', 'second']
+    assert 0.0 <= timer.marks[0][1] <= timer.marks[1][1]
@@ -0,0 +1,112 @@
+import os
+import sqlite3
+
+import pytest
+
+pytest.importorskip('PyQt5')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication
+
+from app.gui.main_window import LogViewer
+from app.utils.database import DEFAULT_DB_PATH
+
+
+@pytest.fixture(scope='module')
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def viewer(qapp, tmp_path):
+    window = LogViewer()
+    # Keep tests away from the user's real settings and error dialogs
+    window.settings = QSettings(str(tmp_path / 'settings.ini'), QSettings.IniFormat)
+    window.errors = []
+    window.show_error_message = window.errors.append
+    yield window
+    if window._db_manager is not None:
+        window._db_manager.close_connection()
+    window.close()
+
+
+def write_csv(path, rows):
+    path.write_text('EventId,Payload\n' + ''.join(f'{row}\n' for row in rows), encoding='utf-8')
+    return str(path)
+
+
+def test_load_csv_saves_case_and_clears_searches(viewer, tmp_path):
+    db_path = str(tmp_path / 'case.db')
+    viewer.settings.setValue('last_case/db_path', db_path)
+    viewer.settings.setValue('last_case/saved_searches', ['SELECT * FROM logs'])
+    viewer.saved_searches_list.addItem('SELECT * FROM logs')
+
+    viewer.load_csv(write_csv(tmp_path / 'logs.csv', ['4624,{}']))
+
+    assert viewer.errors == []
+    assert viewer.settings.value('last_case/db_path') == os.path.abspath(db_path)
+    assert viewer.settings.value('last_case/saved_searches') is None
+    assert viewer.saved_searches_list.count() == 0
+
+
+def test_failed_load_csv_forgets_case(viewer, tmp_path):
+    viewer.settings.setValue('last_case/db_path', str(tmp_path / 'case.db'))
+
+    viewer.load_csv(str(tmp_path / 'missing.csv'))
+
+    assert viewer.errors
+    assert viewer.settings.value('last_case/db_path') is None
+
+
+def test_restore_last_case(viewer, tmp_path):
+    db_path = str(tmp_path / 'case.db')
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE logs ([EventId] TEXT, [Payload] TEXT)")
+    conn.execute("INSERT INTO logs VALUES ('4624', '{}')")
+    conn.commit()
+    conn.close()
+    viewer.settings.setValue('last_case/db_path', db_path)
+    viewer.settings.setValue('last_case/saved_searches', ["SELECT * FROM logs WHERE EventId = '4624'"])
+
+    assert viewer.restore_last_case()
+    assert viewer.model.rowCount() == 1
+    assert viewer.saved_searches_list.count() == 1
+    assert viewer.status_bar.currentMessage() == f"Restored case: {db_path}"
+
+
+@pytest.mark.parametrize('create, message', [
+    (None, "Last case database not found"),
+    (lambda path: path.write_bytes(b'not a sqlite database' * 100),
+     "Last case database is corrupt or has no logs table"),
+    (lambda path: sqlite3.connect(str(path)).close(),
+     "Last case database is corrupt or has no logs table"),
+])
+def test_failed_restore_forgets_case(viewer, tmp_path, create, message):
+    path = tmp_path / 'case.db'
+    if create:
+        create(path)
+    viewer.settings.setValue('last_case/db_path', str(path))
+    viewer.settings.setValue('last_case/saved_searches', ['SELECT * FROM logs'])
+
+    assert not viewer.restore_last_case()
+    assert viewer.status_bar.currentMessage().startswith(message)
+    assert viewer.settings.value('last_case/db_path') is None
+    assert viewer.settings.value('last_case/saved_searches') is None
+    assert viewer.saved_searches_list.count() == 0
+    assert viewer.db_manager.db_path == DEFAULT_DB_PATH
+
+
+def test_drop_database_resets_case(viewer, tmp_path):
+    db_path = str(tmp_path / 'case.db')
+    viewer.settings.setValue('last_case/db_path', db_path)
+    viewer.load_csv(write_csv(tmp_path / 'logs.csv', ['4624,{}']))
+    viewer.search_bar.setText('SELECT * FROM logs')
+    viewer.save_search()
+
+    viewer.drop_database()
+
+    assert not os.path.exists(db_path)
+    assert viewer.settings.value('last_case/db_path') is None
+    assert viewer.settings.value('last_case/saved_searches') is None
+    assert viewer.db_manager.db_path == DEFAULT_DB_PATH